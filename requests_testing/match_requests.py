@@ -1,16 +1,28 @@
 """This script:
 1. Loads a match ID from a YAML configuration file.
 2. Fetches match data from the OpenDota API using that match ID.
-3. Saves the retrieved match data to a YAML file named after the match ID.
+3. Saves the retrieved match data to a JSON file named after the match ID.
 
 The script logs each step, rather than printing large amounts of data.
 """  # noqa: INP001
 
+import functools
+import importlib.util
 import logging
-import os
+from pathlib import Path
 
+import orjson
 import requests
 import yaml
+from requests.adapters import HTTPAdapter
+from urllib3 import BaseHTTPResponse
+from urllib3.exceptions import MaxRetryError, ResponseError
+from urllib3.util import Retry
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without LibYAML
+    from yaml import SafeLoader
 
 # =============================================================================
 # Configuration Section
@@ -19,6 +31,16 @@ import yaml
 CONFIG_YAML_PATH = "requests_testing/configurations.yaml"
 OUTPUT_DIR = "requests_testing/data/matches"
 LOG_LEVEL = logging.DEBUG
+REQUEST_TIMEOUT = 30  # seconds
+# A longer Retry-After (in seconds) fails the request instead of stalling the run
+MAX_RETRY_DELAY = 60
+# Ask for compressed responses; brotli is only advertised when it can be decoded
+HTTP_HEADERS = {
+    "Accept-Encoding": (
+        "gzip, deflate, br" if importlib.util.find_spec("brotli") else "gzip, deflate"
+    ),
+    "User-Agent": "dota2api/1.0",
+}
 
 # Set up logging configuration
 logging.basicConfig(
@@ -27,6 +49,47 @@ logging.basicConfig(
     datefmt="%Y-%m-%d %H:%M:%S",
 )
 
+
+class CappedRetry(Retry):
+    """Retry policy that gives up when the server asks to wait too long."""
+
+    def increment(
+        self,
+        method: str | None = None,
+        url: str | None = None,
+        response: BaseHTTPResponse | None = None,
+        error: Exception | None = None,
+        **kwargs: object,
+    ) -> Retry:
+        """Stop retrying once `Retry-After` exceeds MAX_RETRY_DELAY."""
+        if response is not None:
+            retry_after = self.get_retry_after(response)
+            if retry_after is not None and retry_after > MAX_RETRY_DELAY:
+                cause = f"Retry-After of {retry_after:.0f}s exceeds {MAX_RETRY_DELAY}s"
+                raise MaxRetryError(kwargs.get("_pool"), url, ResponseError(cause))
+        return super().increment(method, url, response, error, **kwargs)
+
+
+# Shared HTTP session: keeps the connection to api.opendota.com alive
+# and retries transient failures
+SESSION = requests.Session()
+SESSION.headers.update(HTTP_HEADERS)
+SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=16,
+        max_retries=CappedRetry(
+            total=5,
+            backoff_factor=0.3,
+            status_forcelist=(429, 500, 502, 503, 504),
+            respect_retry_after_header=True,
+            # Hand the last error response back so raise_for_status() reports it
+            raise_on_status=False,
+        ),
+    ),
+)
+
 # =============
 # Main Function
 # =============
@@ -35,16 +98,23 @@ def main():
     """Main execution flow:
     1. Load the match ID from the YAML file defined in CONFIG_YAML_PATH.
     2. Retrieve match data from the OpenDota API.
-    3. Save the data to a YAML file named after the match ID.
+    3. Save the data to a JSON file named after the match ID.
     """
     match_id = load_match_id_from_yaml(CONFIG_YAML_PATH)
     match_data = get_match_data(match_id)
-    save_match_data_to_yaml(match_id, match_data, OUTPUT_DIR)
+    save_match_data_to_json(match_id, match_data, OUTPUT_DIR)
 
 # =============
 # Supporting Functions
 # =============
 
+@functools.lru_cache(maxsize=1)
+def load_config(file_path: str) -> dict:
+    """Load a YAML configuration file, parsing it only once per path."""
+    with open(file_path, encoding="utf-8") as file:
+        return yaml.load(file, Loader=SafeLoader)
+
+
 def load_match_id_from_yaml(file_path: str) -> int:
     """Load the match ID from a given YAML file.
 
@@ -61,9 +131,8 @@ def load_match_id_from_yaml(file_path: str) -> int:
         ValueError: If 'match_id_test' is not found or the file is invalid.
 
     """
-    logging.info(f"Loading match_id from YAML file: {file_path}")
-    with open(file_path, encoding="utf-8") as file:
-        data = yaml.safe_load(file)
+    logging.info("Loading match_id from YAML file: %s", file_path)
+    data = load_config(file_path)
 
     if not data or "match_id_test" not in data:
         logging.error("No 'match_id_test' key found in the provided YAML file.")
@@ -71,7 +140,7 @@ def load_match_id_from_yaml(file_path: str) -> int:
         raise ValueError(msg)
 
     match_id = data["match_id_test"]
-    logging.debug(f"Loaded match_id: {match_id}")
+    logging.debug("Loaded match_id: %s", match_id)
     return match_id
 
 
@@ -85,32 +154,32 @@ def get_match_data(match_id: int) -> dict:
         dict: The match data as a dictionary.
 
     Raises:
-        requests.HTTPError: If the HTTP request fails.
+        requests.HTTPError: If the API still returns an error status after retries.
     """
-    logging.info(f"Fetching match data from OpenDota API for match_id: {match_id}")
+    logging.info("Fetching match data from OpenDota API for match_id: %s", match_id)
     url = f"https://api.opendota.com/api/matches/{match_id}"
-    response = requests.get(url)
+    response = SESSION.get(url, timeout=REQUEST_TIMEOUT)
     response.raise_for_status()
     logging.debug("Match data successfully retrieved from the API.")
-    return response.json()
+    return orjson.loads(response.content)
 
 
-def save_match_data_to_yaml(match_id: int, match_data: dict, output_dir: str):
-    """Save the retrieved match data to a YAML file named after the match ID.
+def save_match_data_to_json(match_id: int, match_data: dict, output_dir: str):
+    """Save the retrieved match data to a JSON file named after the match ID.
 
     Args:
         match_id (int): The match ID to use for the filename.
         match_data (dict): The match data dictionary to save.
-        output_dir (str): The directory where the YAML file will be stored.
+        output_dir (str): The directory where the JSON file will be stored.
     """
-    if not os.path.exists(output_dir):
-        logging.debug(f"Output directory does not exist, creating: {output_dir}")
-        os.makedirs(output_dir, exist_ok=True)
-
-    filename = os.path.join(output_dir, f"match-{match_id}.yaml")
-    logging.info(f"Saving match data to {filename}")
-    with open(filename, "w", encoding="utf-8") as f:
-        yaml.safe_dump(match_data, f)
+    filename = Path(output_dir) / f"match-{match_id}.json"
+    filename.parent.mkdir(parents=True, exist_ok=True)
+    logging.info("Saving match data to %s", filename)
+    payload = orjson.dumps(match_data, option=orjson.OPT_INDENT_2)
+    # Replace the target only once the whole payload is on disk
+    temp_filename = filename.with_name(f"{filename.name}.tmp")
+    temp_filename.write_bytes(payload)
+    temp_filename.replace(filename)
     logging.debug("Match data successfully saved.")
 
 
@@ -1,44 +1,135 @@
 """This script:
 1. Loads a player ID from a YAML configuration file.
 2. Fetches multiple sets of player data from the OpenDota API.
-3. Saves each set of retrieved data into separate YAML files under a folder named after the player ID.
+3. Saves all retrieved data into a single JSON file named after the player ID,
+   with one top-level key per endpoint (the refresh response gets its own file).
+   Pass `--split` to instead save each set into a separate JSON file
+   under a folder named after the player ID.
 4. Continues running even if one or more endpoints fail, logging errors instead of stopping the script.
-5. Outputs a final dictionary of sections and their statuses (e.g., success, retrieval_failed, save_failed).
+5. Outputs a final dictionary of sections and their statuses
+   (e.g., success, unchanged, retrieval_failed, save_failed).
+
+The ETag of every saved section is stored next to the output, and sent back as
+`If-None-Match` on the next run; sections the API reports as not modified are neither
+re-downloaded nor re-written. The single JSON file is only re-read and rewritten when
+at least one section changed.
 
 We've integrated `rich` to provide colored and enhanced output in the terminal.
+When stderr is not a terminal (e.g. cron or CI runs), plain logging is used instead.
+
+All HTTP requests are issued concurrently over a single `aiohttp` session.
 
 Prerequisites:
 - Python 3.x
-- requests: `pip install requests`
+- aiohttp: `pip install aiohttp`
 - pyyaml: `pip install pyyaml`
+- orjson: `pip install orjson`
 - rich: `pip install rich`
+- brotli (optional, enables brotli-compressed responses): `pip install brotli`
 
 File Structure:
 - configurations.yaml (contains `player_id_test`)
 - This script (e.g., player_additional_data_request.py)
 """
 
+import argparse
+import asyncio
+import functools
+import importlib.util
 import logging
 import os
-
-import requests
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from http import HTTPStatus
+from pathlib import Path
+
+import aiohttp
+import orjson
 import yaml
 from rich.console import Console
 from rich.logging import RichHandler
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without LibYAML
+    from yaml import SafeLoader
+
 # =============================================================================
 # Configuration Section
 # =============================================================================
 CONFIG_YAML_PATH = "requests_testing/configurations.yaml"
 OUTPUT_DIR = "requests_testing/data/players"
 LOG_LEVEL = logging.DEBUG
-
-logging.basicConfig(
-    level=logging.DEBUG,
-    format="%(message)s",
-    datefmt="[%X]",
-    handlers=[RichHandler(rich_tracebacks=True, markup=True)],
+MAX_CONNECTIONS = 16
+REQUEST_TIMEOUT = 30  # seconds
+# Ask for compressed responses; brotli is only advertised when it can be decoded
+HTTP_HEADERS = {
+    "Accept-Encoding": (
+        "gzip, deflate, br" if importlib.util.find_spec("brotli") else "gzip, deflate"
+    ),
+    "User-Agent": "dota2api/1.0",
+}
+SAVE_WORKERS = 8
+RETRY_ATTEMPTS = 5
+RETRY_BACKOFF = 0.3  # seconds, doubled after every failed attempt
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+# A longer Retry-After (in seconds) fails the request instead of stalling the run
+MAX_RETRY_DELAY = 60
+MAX_IN_FLIGHT_REQUESTS = 4  # keeps bursts under OpenDota's free-tier rate limit
+# Returned instead of data when the server answers 304 Not Modified
+NOT_MODIFIED = object()
+
+# Endpoints available by OpenDota API for player data:
+# (key, path under /players/{id}, description)
+ENDPOINT_SPEC = (
+    ("player", "", "general player data"),
+    ("wl", "/wl", "win/loss data"),
+    ("recentMatches", "/recentMatches", "recent matches data"),
+    ("matches", "/matches", "all matches data"),
+    ("heroes", "/heroes", "heroes data"),
+    ("peers", "/peers", "peers data"),
+    ("pros", "/pros", "pros data"),
+    ("totals", "/totals", "totals data"),
+    ("counts", "/counts", "counts data"),
+    ("histograms", "/histograms", "histograms data"),
+    ("wardmap", "/wardmap", "wardmap data"),
+    ("wordcloud", "/wordcloud", "wordcloud data"),
+    ("ratings", "/ratings", "ratings data"),
+    ("rankings", "/rankings", "rankings data"),
 )
+
+
+
+class StripMarkupFilter(logging.Filter):
+    """Remove rich markup tags (e.g. `[bold cyan]`) from records for a plain handler."""
+
+    MARKUP_PATTERN = re.compile(r"\[/?[a-z ]+\]")
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        # Only the format string is touched, so interpolated values
+        # (URLs, paths, errors) are kept verbatim
+        record.msg = self.MARKUP_PATTERN.sub("", str(record.msg))
+        return True
+
+
+# Rich rendering is only worth its cost on an interactive terminal
+if sys.stderr.isatty():
+    logging.basicConfig(
+        level=logging.DEBUG,
+        format="%(message)s",
+        datefmt="[%X]",
+        handlers=[RichHandler(rich_tracebacks=True, markup=True)],
+    )
+else:
+    plain_handler = logging.StreamHandler()
+    plain_handler.addFilter(StripMarkupFilter())
+    logging.basicConfig(
+        level=logging.DEBUG,
+        format="%(asctime)s [%(levelname)s] %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+        handlers=[plain_handler],
+    )
 logger = logging.getLogger(__name__)
 console = Console()
 
@@ -48,85 +139,125 @@ console = Console()
 # =============
 
 
-def main() -> None:
+async def main(*, split: bool = False) -> None:
     """Main execution flow:
     1. Load the player ID from the YAML file defined in CONFIG_YAML_PATH.
-    2. Create a directory based on the player ID.
-    3. Fetch data from each specified endpoint and save each to a separate YAML file if retrieval succeeds.
-    4. Perform a POST to refresh the player data and save the response if successful.
-    5. Output a final dictionary showing the status of each section.
+    2. Create the output directory (one based on the player ID when `split` is set).
+    3. Fetch data from each specified endpoint, and POST to refresh the player data,
+       all concurrently. Sections saved by a previous run are revalidated with their
+       stored ETag.
+    4. Save the successful responses into a single `player-<id>.json` file (the refresh
+       response goes to `player-<id>.refresh.json`), or, when `split` is set, into a
+       separate JSON file per section, writing the files in parallel. Unchanged sections
+       are not re-written; the single file is only rewritten when another section
+       changed, carrying the unchanged ones over from the previous run.
+    5. Save the ETags of the saved sections for the next run, if they changed.
+    6. Output a final dictionary showing the status of each section.
+
+    Args:
+        split (bool): Save each section to its own file instead of one aggregated file.
     """
     logger.info("[bold cyan]Starting player data retrieval process...[/bold cyan]")
     # Loading configurations
     enpoints_config = load_config(CONFIG_YAML_PATH)["endpoints"]
     player_id = load_player_id_from_yaml(CONFIG_YAML_PATH)
 
-    player_dir = os.path.join(OUTPUT_DIR, str(player_id))
-    logger.info(f"Data will be saved under: [bold yellow]{player_dir}[/bold yellow]")
+    player_dir = Path(OUTPUT_DIR, str(player_id)) if split else Path(OUTPUT_DIR)
+    logger.info("Data will be saved under: [bold yellow]%s[/bold yellow]", player_dir)
+    player_dir.mkdir(parents=True, exist_ok=True)
 
     base_url = f"https://api.opendota.com/api/players/{player_id}"
 
-
-    # Endpoints available by OpenDota API for player data
-    endpoints = {
-        "player": (f"{base_url}", "general player data"),
-        "wl": (f"{base_url}/wl", "win/loss data"),
-        "recentMatches": (f"{base_url}/recentMatches", "recent matches data"),
-        "matches": (f"{base_url}/matches", "all matches data"),
-        "heroes": (f"{base_url}/heroes", "heroes data"),
-        "peers": (f"{base_url}/peers", "peers data"),
-        "pros": (f"{base_url}/pros", "pros data"),
-        "totals": (f"{base_url}/totals", "totals data"),
-        "counts": (f"{base_url}/counts", "counts data"),
-        "histograms": (f"{base_url}/histograms", "histograms data"),
-        "wardmap": (f"{base_url}/wardmap", "wardmap data"),
-        "wordcloud": (f"{base_url}/wordcloud", "wordcloud data"),
-        "ratings": (f"{base_url}/ratings", "ratings data"),
-        "rankings": (f"{base_url}/rankings", "rankings data"),
+    # Only format URLs for the endpoints enabled in the configuration
+    active_endpoints = {
+        key: (f"{base_url}{path}", desc)
+        for key, path, desc in ENDPOINT_SPEC
+        if enpoints_config.get(key, False)
     }
-
-    # Based on endpoints_config, create a new active_endpoints dictionary
-    active_endpoints = {key: value for key, value in endpoints.items() if enpoints_config.get(key, False)}
-    logger.info(f"Active endpoints: {active_endpoints.keys()}")
+    logger.info("Active endpoints: %s", active_endpoints.keys())
+
+    # Load the ETags of the previous run
+    data_filename = f"player-{player_id}.json"
+    etags_filename = "etags.json" if split else f"player-{player_id}.etags.json"
+    cached_etags = load_cached_etags(
+        player_dir,
+        etags_filename,
+        None if split else data_filename,
+    )
+
+    # Fetch all GET endpoints and POST the refresh concurrently over one session
+    refresh_url = f"{base_url}/refresh"
+    logger.info(
+        "Attempting to retrieve %d endpoints and "
+        "[magenta]refresh player data[/magenta]...",
+        len(active_endpoints),
+    )
+    connector = aiohttp.TCPConnector(limit=MAX_CONNECTIONS)
+    timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+    semaphore = asyncio.Semaphore(MAX_IN_FLIGHT_REQUESTS)
+    async with aiohttp.ClientSession(
+        connector=connector,
+        timeout=timeout,
+        headers=HTTP_HEADERS,
+    ) as session:
+        # The refresh POST is scheduled first so it takes a semaphore slot right away
+        # instead of queueing behind the GETs; its result is moved to the end afterwards
+        refresh_data, *responses = await asyncio.gather(
+            post(session, semaphore, refresh_url, "player refresh"),
+            *(
+                fetch(session, semaphore, url, desc, cached_etags.get(filename))
+                for filename, (url, desc) in active_endpoints.items()
+            ),
+            return_exceptions=True,
+        )
+    responses.append(refresh_data)
+
+    # (filename, description) of every section, in the same order as responses
+    sections = [(filename, desc) for filename, (_, desc) in active_endpoints.items()]
+    sections.append(("refresh", "refresh data"))
 
     # Results dictionary to store the status of each section
-    results = {}
-
-    # Fetch and save GET endpoints
-    for filename, (url, desc) in active_endpoints.items():
-        logger.info(f"Attempting to retrieve [magenta]{desc}[/magenta]...")
-        data = fetch_data_from_endpoint(url, desc)
-        if data is not None:
-            logger.info(f"[green]Successfully retrieved[/green] {desc}. Now saving...")
-            save_success = save_data_to_yaml(data, player_dir, f"{filename}.yaml", desc)
-            if save_success:
-                results[filename] = "success"
-            else:
-                results[filename] = "save_failed"
-        else:
-            logger.warning(f"[yellow]Skipping saving {desc} due to retrieval failure.[/yellow]")
-            results[filename] = "retrieval_failed"
+    results = dict.fromkeys(filename for filename, _ in sections)
 
-    # Attempt POST to refresh endpoint and save the response
-    refresh_url = f"{base_url}/refresh"
-    logger.info("Attempting to [magenta]refresh player data[/magenta]...")
-    refresh_data = post_data_to_endpoint(refresh_url, "player refresh")
-    if refresh_data is not None:
-        logger.info("[green]Successfully refreshed[/green] player data. Now saving...")
-        save_success = save_data_to_yaml(refresh_data, player_dir, "refresh.yaml", "refresh data")
-        if save_success:
-            results["refresh"] = "success"
-        else:
-            results["refresh"] = "save_failed"
+    # Collect the sections that were retrieved successfully,
+    # and the ETags to store for the next run
+    payloads, etags = collect_responses(sections, responses, results)
+
+    if split:
+        save_split_sections(payloads, player_dir, results)
     else:
-        logger.warning("[yellow]Skipping saving refresh data due to retrieval failure.[/yellow]")
-        results["refresh"] = "retrieval_failed"
+        refresh_filename = f"player-{player_id}.refresh.json"
+        save_aggregated_sections(
+            payloads,
+            player_dir,
+            data_filename,
+            refresh_filename,
+            results,
+        )
+
+    # Only remember ETags for sections whose data is on disk
+    etags = {
+        filename: etag
+        for filename, etag in etags.items()
+        if results[filename] in ("success", "unchanged")
+    }
+    if etags != cached_etags:
+        save_data_to_json(etags, player_dir, etags_filename, "ETag data")
 
     logger.info("[bold cyan]Data fetching process completed.[/bold cyan]")
     logger.info("Final Results:")
+    # Markup stays in the format string so StripMarkupFilter can strip it
+    status_formats = {
+        "success": "[green]%s: %s[/green]",
+        "unchanged": "[green]%s: %s[/green]",
+        "save_failed": "[red]%s: %s[/red]",
+    }
     for section, status in results.items():
-        color = "green" if status == "success" else "red" if status == "save_failed" else "yellow"
-        logger.info(f"[{color}]{section}: {status}[/{color}]")
+        logger.info(
+            status_formats.get(status, "[yellow]%s: %s[/yellow]"),
+            section,
+            status,
+        )
 
     console.print("\n[bold underline magenta]Final Results Dictionary:[/bold underline magenta]", results)
 
@@ -137,10 +268,11 @@ def main() -> None:
 # Supporting Functions
 # =============================================================================
 
+@functools.lru_cache(maxsize=1)
 def load_config(file_path: str) -> dict:
-    """Load a YAML configuration file."""
+    """Load a YAML configuration file, parsing it only once per path."""
     with open(file_path, encoding="utf-8") as file:
-        return yaml.safe_load(file)
+        return yaml.load(file, Loader=SafeLoader)
 
 def load_player_id_from_yaml(file_path: str) -> int:
     """
@@ -152,13 +284,15 @@ def load_player_id_from_yaml(file_path: str) -> int:
     Returns:
         int: The player ID extracted from the YAML file.
     """
-    logger.info(f"Loading player_id from YAML file: [bold yellow]{file_path}[/bold yellow]")
+    logger.info(
+        "Loading player_id from YAML file: [bold yellow]%s[/bold yellow]",
+        file_path,
+    )
     if not os.path.isfile(file_path):
-        logger.error(f"[red]The file {file_path} does not exist.[/red]")
+        logger.error("[red]The file %s does not exist.[/red]", file_path)
         raise FileNotFoundError(f"The file {file_path} does not exist.")
 
-    with open(file_path, encoding="utf-8") as file:
-        data = yaml.safe_load(file)
+    data = load_config(file_path)
 
     if not data or "player_id_test" not in data:
         logger.error("[red]No 'player_id_test' key found in the provided YAML file.[/red]")
@@ -166,78 +300,370 @@ def load_player_id_from_yaml(file_path: str) -> int:
 
     player_id = data["player_id_test"]
     if not isinstance(player_id, int):
-        logger.error(f"[red]player_id_test should be an integer, got {type(player_id)} instead.[/red]")
+        logger.error(
+            "[red]player_id_test should be an integer, got %s instead.[/red]",
+            type(player_id),
+        )
         raise ValueError("player_id_test value must be an integer.")
 
-    logger.debug(f"Loaded player_id: {player_id}")
+    logger.debug("Loaded player_id: %s", player_id)
     return player_id
 
 
-def fetch_data_from_endpoint(url: str, description: str) -> dict or list or None:
-    """Fetch data from a given endpoint and return the JSON response.
+async def request_json(
+    session: aiohttp.ClientSession,
+    semaphore: asyncio.Semaphore,
+    method: str,
+    url: str,
+    etag: str | None = None,
+) -> tuple:
+    """Issue a request and decode its JSON body, retrying transient GET failures.
+
+    Retries back off exponentially. A `Retry-After` header sent with the error response
+    takes precedence over the computed backoff, unless it asks to wait longer than
+    MAX_RETRY_DELAY, in which case the error is raised instead. The semaphore is only
+    held while a request is in flight, not while waiting to retry. Other methods are
+    sent once: like urllib3's Retry defaults, a POST is not assumed to be idempotent.
+    When `etag` is given it is sent as `If-None-Match`, and a 304 returns NOT_MODIFIED.
 
     Args:
-        url (str): The URL of the endpoint to fetch data from.
-        description (str): A description of the data being fetched.
+        session (aiohttp.ClientSession): The shared HTTP session to send the request on.
+        semaphore (asyncio.Semaphore): Bounds the number of requests in flight at once.
+        method (str): The HTTP method to use.
+        url (str): The URL to request.
+        etag (str | None): The ETag of the previously retrieved response, if any.
 
     Returns:
-        dict or list or None: The JSON response data retrieved from the endpoint.
+        tuple: The decoded JSON response (or NOT_MODIFIED) and the response's ETag.
 
     Raises:
-        requests.HTTPError: If there is an HTTP error while fetching the data.
+        aiohttp.ClientResponseError: If the request fails with a non-retryable status
+            or retries are exhausted.
+    """
+    attempts = RETRY_ATTEMPTS if method == "GET" else 1
+    for attempt in range(attempts - 1):
+        try:
+            return await send_request(session, semaphore, method, url, etag)
+        except aiohttp.ClientResponseError as e:
+            if e.status not in RETRY_STATUSES:
+                raise
+            retry_after = (e.headers or {}).get("Retry-After", "")
+            delay = (
+                int(retry_after)
+                if retry_after.isdigit()
+                else RETRY_BACKOFF * 2**attempt
+            )
+            if delay > MAX_RETRY_DELAY:
+                logger.warning(
+                    "[yellow]%s %s asked to retry after %ss, giving up.[/yellow]",
+                    method,
+                    url,
+                    delay,
+                )
+                raise
+            logger.warning(
+                "[yellow]%s %s returned %s, retrying in %.1fs...[/yellow]",
+                method,
+                url,
+                e.status,
+                delay,
+            )
+            await asyncio.sleep(delay)
+    return await send_request(session, semaphore, method, url, etag)
+
+
+async def send_request(
+    session: aiohttp.ClientSession,
+    semaphore: asyncio.Semaphore,
+    method: str,
+    url: str,
+    etag: str | None,
+) -> tuple:
+    """Send one request and return its decoded JSON body (or NOT_MODIFIED) and ETag."""
+    headers = {"If-None-Match": etag} if etag else None
+    async with semaphore, session.request(
+        method,
+        url,
+        headers=headers,
+        raise_for_status=True,
+    ) as response:
+        if response.status == HTTPStatus.NOT_MODIFIED:
+            return NOT_MODIFIED, response.headers.get("ETag", etag)
+        return orjson.loads(await response.read()), response.headers.get("ETag")
+
+
+async def fetch(
+    session: aiohttp.ClientSession,
+    semaphore: asyncio.Semaphore,
+    url: str,
+    description: str,
+    etag: str | None = None,
+) -> tuple:
+    """Fetch data from a given endpoint and return the JSON response and its ETag.
+
+    Args:
+        session (aiohttp.ClientSession): The shared HTTP session to send the request on.
+        semaphore (asyncio.Semaphore): Bounds the number of requests in flight at once.
+        url (str): The URL of the endpoint to fetch data from.
+        description (str): A description of the data being fetched.
+        etag (str | None): The ETag stored for this endpoint by a previous run, if any.
 
+    Returns:
+        tuple: The JSON response data retrieved from the endpoint (NOT_MODIFIED if
+        unchanged since `etag`, None on an HTTP error) and the response's ETag.
     """
-    logger.debug(f"Fetching {description} from endpoint: {url}")
-    response = requests.get(url)
+    logger.debug("Fetching %s from endpoint: %s", description, url)
     try:
-        response.raise_for_status()
-    except requests.HTTPError as e:
-        logger.exception(f"[red]Failed to fetch {description} data: {e}[/red]")
-        return None
+        data, etag = await request_json(session, semaphore, "GET", url, etag)
+    except aiohttp.ClientResponseError as e:
+        logger.exception("[red]Failed to fetch %s data: %s[/red]", description, e)
+        return None, None
 
-    data = response.json()
-    logger.debug(f"{description} retrieved successfully. Type: {type(data)}")
-    return data
+    if data is NOT_MODIFIED:
+        logger.debug("%s not modified since ETag %s", description, etag)
+    else:
+        logger.debug("%s retrieved successfully. Type: %s", description, type(data))
+    return data, etag
 
 
-def post_data_to_endpoint(url: str, description: str) -> dict or list or None:
-    logger.debug(f"Posting to {description} endpoint: {url}")
-    response = requests.post(url)
+async def post(
+    session: aiohttp.ClientSession,
+    semaphore: asyncio.Semaphore,
+    url: str,
+    description: str,
+) -> tuple:
+    logger.debug("Posting to %s endpoint: %s", description, url)
     try:
-        response.raise_for_status()
-    except requests.HTTPError as e:
-        logger.exception(f"[red]Failed to POST {description}: {e}[/red]")
-        return None
+        data, _ = await request_json(session, semaphore, "POST", url)
+    except aiohttp.ClientResponseError as e:
+        logger.exception("[red]Failed to POST %s: %s[/red]", description, e)
+        return None, None
 
-    data = response.json()
-    logger.debug(f"POST {description} succeeded. Type: {type(data)}")
-    return data
+    logger.debug("POST %s succeeded. Type: %s", description, type(data))
+    # POST responses are never revalidated, so no ETag is returned
+    return data, None
 
 
-def save_data_to_yaml(data: dict or list, directory: str, filename: str, description: str) -> bool:
-    """Save data to a YAML file. Used in the main function to save retrieved data.
+def load_cached_etags(
+    player_dir: Path,
+    etags_filename: str,
+    data_filename: str | None,
+) -> dict:
+    """Load the ETags stored by the previous run whose saved data is still on disk.
+
+    Args:
+        player_dir (Path): The directory the data and ETags are saved in.
+        etags_filename (str): The filename the ETags are saved as.
+        data_filename (str | None): The aggregated data file, or None when each
+            section has its own file.
+
+    Returns:
+        dict: The ETag of each section, keyed by section name.
+    """
+    etags = load_json(player_dir / etags_filename)
+    if data_filename is None:
+        return {
+            filename: etag
+            for filename, etag in etags.items()
+            if (player_dir / f"{filename}.json").is_file()
+        }
+    return etags if (player_dir / data_filename).is_file() else {}
+
+
+def collect_responses(sections: list, responses: list, results: dict) -> tuple:
+    """Sort the responses into sections to save and ETags to keep.
+
+    Unchanged and failed sections are recorded in `results`.
+
+    Args:
+        sections (list): (section name, description) of every section, in the same
+            order as `responses`.
+        responses (list): The (data, ETag) returned for each section, or the exception
+            it raised.
+        results (dict): The status of each section, updated in place.
+
+    Returns:
+        tuple: The (section name, data, description) of every retrieved section, and
+        the ETag of every retrieved or unchanged section, keyed by section name.
+    """
+    payloads = []
+    etags = {}
+    for (filename, desc), response in zip(sections, responses, strict=True):
+        if isinstance(response, BaseException):
+            logger.error(
+                "[red]Unexpected error while retrieving %s: %r[/red]",
+                desc,
+                response,
+            )
+            data, etag = None, None
+        else:
+            data, etag = response
+        if data is NOT_MODIFIED:
+            logger.info(
+                "[green]%s unchanged[/green] since the last run. Skipping save.",
+                desc.capitalize(),
+            )
+            results[filename] = "unchanged"
+            etags[filename] = etag
+        elif data is not None:
+            logger.info("[green]Successfully retrieved[/green] %s. Now saving...", desc)
+            payloads.append((filename, data, desc))
+            if etag:
+                etags[filename] = etag
+        else:
+            logger.warning(
+                "[yellow]Skipping saving %s due to retrieval failure.[/yellow]",
+                desc,
+            )
+            results[filename] = "retrieval_failed"
+
+    return payloads, etags
+
+
+def save_split_sections(payloads: list, player_dir: Path, results: dict) -> None:
+    """Save each retrieved section to its own file in parallel, updating `results`.
+
+    Args:
+        payloads (list): (section name, data, description) of every retrieved section.
+        player_dir (Path): The directory to save the files in.
+        results (dict): The status of each section, updated in place.
+    """
+    with ThreadPoolExecutor(max_workers=SAVE_WORKERS) as executor:
+        futures = {
+            executor.submit(
+                save_data_to_json,
+                data,
+                player_dir,
+                f"{filename}.json",
+                desc,
+            ): filename
+            for filename, data, desc in payloads
+        }
+        for future in as_completed(futures):
+            results[futures[future]] = "success" if future.result() else "save_failed"
+
+
+def save_aggregated_sections(
+    payloads: list,
+    player_dir: Path,
+    data_filename: str,
+    refresh_filename: str,
+    results: dict,
+) -> None:
+    """Save the retrieved GET sections into one file keyed by section name.
+
+    The refresh response is saved to its own file, since it is fetched on every run.
+    The aggregated file is only re-read and rewritten when at least one GET section
+    changed; sections marked unchanged or failed in `results` are then carried over
+    from the previous file. The outcome of every save is recorded in `results`.
+
+    Args:
+        payloads (list): (section name, data, description) of every retrieved section.
+        player_dir (Path): The directory to save the files in.
+        data_filename (str): The filename the GET sections are saved as.
+        refresh_filename (str): The filename the refresh response is saved as.
+        results (dict): The status of each section, updated in place.
+    """
+    changed = {}
+    for filename, data, desc in payloads:
+        if filename == "refresh":
+            save_success = save_data_to_json(data, player_dir, refresh_filename, desc)
+            results[filename] = "success" if save_success else "save_failed"
+        else:
+            changed[filename] = data
+    if not changed:
+        return
+
+    # Sections that were not retrieved this run keep their previous value
+    carried_over = {
+        filename
+        for filename, status in results.items()
+        if filename != "refresh" and status in ("unchanged", "retrieval_failed")
+    }
+    previous_data = load_json(player_dir / data_filename) if carried_over else {}
+    combined = {}
+    for filename, status in results.items():
+        if filename in changed:
+            combined[filename] = changed[filename]
+        elif filename in carried_over and filename in previous_data:
+            combined[filename] = previous_data[filename]
+        elif status == "unchanged":
+            logger.warning(
+                "[yellow]%s is missing from %s, re-fetching it next run.[/yellow]",
+                filename,
+                data_filename,
+            )
+            results[filename] = "save_failed"
+
+    save_success = save_data_to_json(combined, player_dir, data_filename, "player data")
+    for filename in changed:
+        results[filename] = "success" if save_success else "save_failed"
+
+
+def load_json(path: Path) -> dict:
+    """Load a JSON object saved by a previous run ({} if missing or unreadable)."""
+    try:
+        data = orjson.loads(path.read_bytes())
+    except FileNotFoundError:
+        return {}
+    except (OSError, orjson.JSONDecodeError) as e:
+        logger.warning("[yellow]Ignoring unreadable %s: %s[/yellow]", path, e)
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def save_data_to_json(
+    data: dict or list,
+    directory: Path,
+    filename: str,
+    description: str,
+) -> bool:
+    """Save data to a JSON file. Used in the main function to save retrieved data.
 
     Args:
         data (dict or list): The data to save.
-        directory (str): The directory to save the file in.
+        directory (Path): The directory to save the file in. Must already exist.
         filename (str): The filename to save the data as.
         description (str): A description of the data being saved.
     """
-    if not os.path.exists(directory):
-        logger.debug(f"Output directory does not exist, creating: {directory}")
-        os.makedirs(directory, exist_ok=True)
+    filepath = directory / filename
+    logger.debug("Saving %s to %s", description, filepath)
+    try:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    except orjson.JSONEncodeError as e:
+        logger.error("[red]Failed to encode %s as JSON: %s[/red]", description, e)
+        return False
 
-    filepath = os.path.join(directory, filename)
-    logger.debug(f"Saving {description} to {filepath}")
+    # Write to a temp file and swap it in, so a failed write keeps the previous file
+    temp_path = filepath.with_name(f"{filepath.name}.tmp")
     try:
-        with open(filepath, "w", encoding="utf-8") as f:
-            yaml.safe_dump(data, f)
-        logger.info(f"[green]{description.capitalize()} successfully saved[/green] to {filepath}")
+        temp_path.write_bytes(payload)
+        temp_path.replace(filepath)
+        logger.info(
+            "[green]%s successfully saved[/green] to %s",
+            description.capitalize(),
+            filepath,
+        )
         return True
     except OSError as e:
-        logger.error(f"[red]Failed to write {description} to {filepath}: {e}[/red]")
+        logger.error(
+            "[red]Failed to write %s to %s: %s[/red]",
+            description,
+            filepath,
+            e,
+        )
+        temp_path.unlink(missing_ok=True)
         return False
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(
+        description="Fetch player data from the OpenDota API.",
+    )
+    parser.add_argument(
+        "--split",
+        action="store_true",
+        help="save each endpoint to its own JSON file instead of one aggregated file",
+    )
+    args = parser.parse_args()
+    asyncio.run(main(split=args.split))